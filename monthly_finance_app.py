@@ -1,25 +1,96 @@
 import argparse
-import csv
+import sys
+import warnings
+from collections import defaultdict
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+import numpy as np
 import pandas as pd
 
 
+RESERVED_COLUMNS = frozenset(('Month', 'Budget'))
+
+
+def _classify_columns(columns):
+    """
+    Split CSV column names into expense and income columns, leaving out Month and Budget.
+    Columns containing 'Income' are income sources; the rest are expense categories.
+
+    Returns:
+    tuple: (expense_cols, income_cols) as lists of column names.
+    """
+    expense_cols = []
+    income_cols = []
+    for column in columns:
+        if 'Income' in column:
+            income_cols.append(column)
+        elif column not in RESERVED_COLUMNS:
+            expense_cols.append(column)
+    return expense_cols, income_cols
+
+
+def _column_modes(matrix):
+    """
+    Find the most common value of each column, picking the smallest value when several are tied.
+    Missing (NaN) values are ignored; a column with no values at all gets NaN as its mode.
+    """
+    ordered = np.sort(matrix, axis=0)
+    rows = np.arange(len(ordered))[:, None]
+    new_run = np.ones(ordered.shape, dtype=bool)
+    new_run[1:] = ordered[1:] != ordered[:-1]
+    run_start = np.maximum.accumulate(np.where(new_run, rows, 0), axis=0)
+    run_length = np.where(np.isnan(ordered), 0, rows - run_start + 1)
+    return ordered[np.argmax(run_length, axis=0), np.arange(ordered.shape[1])]
+
+
 class FinanceData:
     """
     A base class for handling financial data collection and storage.
 
     Attributes:
     - months: List of months for which data is collected.
-    - budgets_data: List of monthly budget amounts.
-    - expenses_data: List of dictionaries, each representing expense categories and their values for a given month.
-    - incomes_data: List of dictionaries, each representing income sources and their values for a given month.
+    - budgets_data: Array of monthly budget amounts.
+    - expense_categories: List of expense category names.
+    - expense_matrix: 2D array of expense values, one row per month and one column per expense category.
+    - income_sources: List of income source names.
+    - income_matrix: 2D array of income values, one row per month and one column per income source.
     """
     
     def __init__(self):
         self.months = []
-        self.budgets_data = []
-        self.expenses_data = []
-        self.incomes_data = []
+        self.budgets_data = np.empty(0, dtype=np.float64)
+        self.expense_categories = []
+        self.expense_matrix = np.empty((0, 0), dtype=np.float64)
+        self.income_sources = []
+        self.income_matrix = np.empty((0, 0), dtype=np.float64)
+        self._expense_totals = np.empty(0, dtype=np.float64)
+        self._income_totals = np.empty(0, dtype=np.float64)
+        self._totals_source = None
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """
+        Alternative constructor that builds an instance from a DataFrame laid out like the CSV input.
+
+        Args:
+        - df (DataFrame): Monthly data with 'Month' and 'Budget' columns plus expense and income columns.
+
+        Returns:
+        An instance holding the DataFrame's data, without prompting for input or reading a file.
+        """
+        obj = cls()
+        obj._load_dataframe(df)
+        return obj
+
+    @property
+    def expenses_data(self):
+        """List of dictionaries, each representing expense categories and their values for a given month."""
+        return [dict(zip(self.expense_categories, row)) for row in self.expense_matrix.tolist()]
+
+    @property
+    def incomes_data(self):
+        """List of dictionaries, each representing income sources and their values for a given month."""
+        return [dict(zip(self.income_sources, row)) for row in self.income_matrix.tolist()]
 
     def collect_monthly_data(self, input_csv=None):
         """
@@ -29,39 +100,79 @@ class FinanceData:
         """
         if input_csv:
             try:
-                with open(input_csv, mode='r') as file:
-                    reader = csv.DictReader(file)
-                    for row in reader:
-                        self.months.append(row['Month'])
-                        self.budgets_data.append(float(row['Budget']))
-                        
-                        expenses = {category: float(row[category]) for category in row.keys() if category != 'Month' and category != 'Budget'}
-                        incomes = {source: float(row[source]) for source in row.keys() if 'Income' in source}
-                        
-                        self.expenses_data.append(expenses)
-                        self.incomes_data.append(incomes)
+                dtype_map = defaultdict(lambda: np.float64, Month=object)
+                df = pd.read_csv(input_csv, memory_map=True, dtype=dtype_map)
+                self._load_dataframe(df)
             except FileNotFoundError:
                 print(f"Error: File {input_csv} not found.")
-            except csv.Error:
+            except (pd.errors.ParserError, KeyError, ValueError):
                 print("Error reading CSV. Please check the file format.")
         else:
-            for month in range(1, 13):
-                self.months.append(f"{month}/2023")
-                
-                budget = self._get_input(f"Enter budget for month {month}: ")
-                self.budgets_data.append(budget)
-                
-                expenses = {
-                    "Extras": self._get_input(f"Enter expenses for extras in month {month}: "),
-                    "Utilities": self._get_input(f"Enter expenses for Utilities in month {month}: ")
-                }
-                incomes = {
-                    "Salary": self._get_input(f"Enter income from Salary in month {month}: "),
-                    "Investments": self._get_input(f"Enter income from Investments in month {month}: ")
-                }
-
-                self.expenses_data.append(expenses)
-                self.incomes_data.append(incomes)
+            self.months = [f"{month}/2023" for month in range(1, 13)]
+
+            if sys.stdin.isatty():
+                values = np.empty((12, 5), dtype=np.float64)
+                for month in range(1, 13):
+                    values[month - 1] = [
+                        self._get_input(f"Enter budget for month {month}: "),
+                        self._get_input(f"Enter expenses for extras in month {month}: "),
+                        self._get_input(f"Enter expenses for Utilities in month {month}: "),
+                        self._get_input(f"Enter income from Salary in month {month}: "),
+                        self._get_input(f"Enter income from Investments in month {month}: ")
+                    ]
+            else:
+                values = self._read_scripted_input(12 * 5).reshape(12, 5)
+
+            self.budgets_data = values[:, 0]
+            self.expense_categories = ["Extras", "Utilities"]
+            self.expense_matrix = values[:, 1:3]
+            self.income_sources = ["Salary", "Investments"]
+            self.income_matrix = values[:, 3:5]
+
+    def _load_dataframe(self, df):
+        """
+        Helper method to split a CSV-shaped DataFrame into months, budgets, expense and income data.
+        Every column is read before any attribute is assigned, so a missing column leaves the data unchanged.
+        """
+        expense_cols, income_cols = _classify_columns(df.columns)
+
+        months = df['Month'].tolist()
+        budgets = df['Budget'].to_numpy(dtype=np.float64, copy=True)
+        expense_matrix = df[expense_cols].to_numpy(dtype=np.float64, copy=True)
+        income_matrix = df[income_cols].to_numpy(dtype=np.float64, copy=True)
+
+        self.months = months
+        self.budgets_data = budgets
+        self.expense_categories = expense_cols
+        self.expense_matrix = expense_matrix
+        self.income_sources = income_cols
+        self.income_matrix = income_matrix
+
+    def _monthly_totals(self):
+        """
+        Helper method to return the total expenses and incomes for each month.
+        The totals are cached and recomputed whenever expense_matrix or income_matrix has been replaced,
+        whether by collect_monthly_data or by assigning new arrays directly.
+        Missing (NaN) amounts are skipped, the same way analysis skips them.
+        """
+        if self._totals_source is None or self._totals_source[0] is not self.expense_matrix or self._totals_source[1] is not self.income_matrix:
+            self._expense_totals = np.nansum(self.expense_matrix, axis=1)
+            self._income_totals = np.nansum(self.income_matrix, axis=1)
+            self._totals_source = (self.expense_matrix, self.income_matrix)
+        return self._expense_totals, self._income_totals
+
+    def _read_scripted_input(self, count):
+        """
+        Helper method to read and validate piped (non-interactive) input in a single pass.
+        Each line holds one value; invalid and negative lines are skipped, just as the interactive prompt would re-ask for them.
+        """
+        tokens = pd.Series(sys.stdin.read().splitlines(), dtype=object)
+        values = pd.to_numeric(tokens, errors='coerce').to_numpy(dtype=np.float64)
+        # Non-numeric lines are NaN after to_numeric, and NaN >= 0 is False, so one mask drops them with the negatives
+        values = values[values >= 0]
+        if values.size < count:
+            raise EOFError(f"Expected {count} values from input but got {values.size}.")
+        return values[:count]
 
     def _get_input(self, prompt):
         """
@@ -69,7 +180,7 @@ class FinanceData:
         """
         while True:
             try:
-                value = float(input(prompt))
+                value = np.float64(input(prompt))
                 if value >= 0:
                     return value
                 else:
@@ -84,35 +195,45 @@ class MonthlyFinanceTracker(FinanceData):
     """
     def display_monthly_summaries(self):
         """Display monthly summaries including expenses, budgets, and budget progress.""" 
+        total_expenses = self._monthly_totals()[0]
+        budget_remaining = self.budgets_data - total_expenses
+
+        # Building every summary first so the whole report is written to stdout at once
+        parts = []
         for month in range(len(self.months)):
-            print(f"Month: {self.months[month]}")
-            print("Expenses:")
-            total_expenses = sum(self.expenses_data[month].values())
-            for category, amount in self.expenses_data[month].items():
-                print(f"{category}: ${amount:.2f}")
-            print(f"Total Expenses: ${total_expenses:.2f}")
-            print(f"Budget: ${self.budgets_data[month]:.2f}")
-            budget_remaining = self.budgets_data[month] - total_expenses
-            print(f"Budget Remaining: ${budget_remaining:.2f}")
-            print()
+            category_lines = "".join(
+                f"{category}: ${amount:.2f}\n" for category, amount in zip(self.expense_categories, self.expense_matrix[month])
+            )
+            parts.append(
+                f"Month: {self.months[month]}\n"
+                "Expenses:\n"
+                f"{category_lines}"
+                f"Total Expenses: ${total_expenses[month]:.2f}\n"
+                f"Budget: ${self.budgets_data[month]:.2f}\n"
+                f"Budget Remaining: ${budget_remaining[month]:.2f}\n"
+            )
+        sys.stdout.write("\n".join(parts) + ("\n" if parts else ""))
 
     def visualize_finances(self):
         """
         Creates a line graph to visualize monthly budgets, expenses, and incomes over the course of a year.
 
         This method uses matplotlib to produce a graph showing trends in budgets, total expenses, and total incomes.
-        Each data type is represented as a separate line in the graph.
+        Each data type is represented as a separate line in the graph, drawn as one LineCollection plus one
+        scatter of markers, so the lines and markers don't add an artist per month (the tick labels still do).
         """
-        plt.figure(figsize=(10, 6))
-        plt.plot(self.months, self.budgets_data, marker='o', label='Budgets')
-        plt.plot(self.months, [sum(expenses.values()) for expenses in self.expenses_data], marker='o', label='Expenses')
-        if self.incomes_data:
-            plt.plot(self.months, [sum(incomes.values()) for incomes in self.incomes_data], marker='o', label='Incomes')
+        _, ax = plt.subplots(figsize=(10, 6))
+        x = np.arange(len(self.months))
+        series = np.vstack([self.budgets_data, *self._monthly_totals()])
+        for values, label, color in zip(series, ['Budgets', 'Expenses', 'Incomes'], ['C0', 'C1', 'C2']):
+            ax.add_collection(LineCollection([np.column_stack([x, values])], colors=color, label=label))
+            ax.scatter(x, values, color=color)
+        ax.autoscale_view()
         plt.xlabel('Month')
         plt.ylabel('Amount ($)')
         plt.title('Personal Finances Over a Year')
         plt.legend()
-        plt.xticks(rotation=45)
+        plt.xticks(x, self.months, rotation=45)
         plt.tight_layout()
         plt.grid()
         plt.show()
@@ -126,21 +247,7 @@ class MonthlyFinanceTracker(FinanceData):
         Args:
         - filename (str): Name of the CSV file to save data to.
         """
-        data = {
-            "Month": self.months,
-            "Budget": self.budgets_data
-        }
-
-        for category in self.expenses_data[0].keys():
-            data[category] = [expenses[category] for expenses in self.expenses_data]
-
-        for source in self.incomes_data[0].keys():
-            data[source] = [incomes[source] for incomes in self.incomes_data]
-
-        with open(filename, mode='w', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(data.keys())
-            writer.writerows(zip(*data.values()))
+        self.to_dataframe().to_csv(filename, index=False)
 
         print(f"Data saved to {filename}")
         
@@ -151,31 +258,31 @@ class MonthlyFinanceTracker(FinanceData):
         Returns:
         DataFrame: A Pandas DataFrame containing the monthly budgets, incomes, and expenses data.
         """
-        data = {
-            "Month": self.months,
-            "Budget": self.budgets_data
-        }
-
-        for category in self.expenses_data[0].keys():
-            data[category] = [expenses[category] for expenses in self.expenses_data]
-
-        for source in self.incomes_data[0].keys():
-            data[source] = [incomes[source] for incomes in self.incomes_data]
-
-        return pd.DataFrame(data)
+        full = np.column_stack([self.budgets_data, self.expense_matrix, self.income_matrix])
+        df = pd.DataFrame(full, columns=['Budget'] + self.expense_categories + self.income_sources)
+        df.insert(0, 'Month', pd.Categorical(self.months, categories=pd.unique(pd.Series(self.months)), ordered=True))
+        return df
 
     def analysis(self):
         """Perform statistical analysis on the data and display the results."""
-        df = self.to_dataframe()
-
-        # Calculating and displaying mean, median, and mode for Budgets, Incomes, and Expenses
-        for column in df.columns:
-            if column != 'Month':  # Exclude 'Month' from analysis
-                print(f"Analysis for {column}:\n")
-                print(f"Mean: {df[column].mean()}")
-                print(f"Median: {df[column].median()}")
-                mode = df[column].mode()
-                print(f"Mode: {mode[0] if not mode.empty else 'No mode'}\n")
+        if not len(self.months):
+            return
+
+        # Calculating mean, median, and mode for Budgets, Incomes, and Expenses across all columns at once
+        full = np.column_stack([self.budgets_data, self.expense_matrix, self.income_matrix])
+        names = ['Budget'] + self.expense_categories + self.income_sources
+        # Missing values are skipped; columns with no values at all report nan instead of warning
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            means = np.nanmean(full, axis=0)
+            medians = np.nanmedian(full, axis=0)
+        modes = _column_modes(full)
+
+        for column, mean, median, mode in zip(names, means, medians, modes):
+            print(f"Analysis for {column}:\n")
+            print(f"Mean: {mean}")
+            print(f"Median: {median}")
+            print(f"Mode: {mode if not np.isnan(mode) else 'No mode'}\n")
                 
         
 def parse_args():
@@ -1,22 +1,49 @@
 import pytest
 import sys
 from io import StringIO
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 from monthly_finance_app import MonthlyFinanceTracker
 
 @pytest.fixture
 def tracker():
-    # Mocking the stdin input for 12 months
-    input_data = "n\n" + "1000\n200\n50\n5000\n100\n" * 12
-    sys.stdin = StringIO(input_data)
-    tr = MonthlyFinanceTracker()
-    tr.collect_monthly_data()
-    return tr
-
-def test_save_data(tracker):
+    # Building 12 months of data directly, without going through stdin
+    df = pd.DataFrame({
+        "Month": [f"{month}/2023" for month in range(1, 13)],
+        "Budget": [1000] * 12,
+        "Extras": [200] * 12,
+        "Utilities": [50] * 12,
+        "Income_Salary": [5000] * 12,
+        "Income_Investments": [100] * 12
+    })
+    return MonthlyFinanceTracker.from_dataframe(df)
+
+def test_save_data(tracker, tmp_path):
     # This should test the method that saves data (if there's one)
     # Assuming there's a method called save_data() in the MonthlyFinanceTracker class
-    tracker.save_data("test_save.csv")
+    output_csv = tmp_path / "test_save.csv"
+    tracker.save_data(str(output_csv))
     # Check if "test_save.csv" exists, and if its contents match what's expected
+    lines = output_csv.read_text().splitlines()
+    assert lines[0] == "Month,Budget,Extras,Utilities,Income_Salary,Income_Investments"
+    assert lines[1] == "1/2023,1000.0,200.0,50.0,5000.0,100.0"
+    assert len(lines) == 13
+
+def test_from_dataframe(tracker):
+    assert len(tracker.months) == 12
+    assert tracker.expense_categories == ["Extras", "Utilities"]
+    assert tracker.income_sources == ["Income_Salary", "Income_Investments"]
+    assert tracker.budgets_data[0] == 1000
+    assert tracker.expenses_data[0]["Utilities"] == 50
+    assert tracker.incomes_data[0]["Income_Salary"] == 5000
+
+def test_to_dataframe_month_order(tracker):
+    months = tracker.to_dataframe()["Month"]
+
+    assert months.cat.ordered
+    assert months.cat.categories.tolist() == tracker.months
+    assert months.sort_values().tolist() == tracker.months
 
 def test_manual_input():
     sys.stdin = StringIO("n\n" + "1000\n200\n50\n5000\n100\n" * 12)
@@ -30,17 +57,137 @@ def test_manual_input():
     assert finance_data.expenses_data[0]["Utilities"] == 50
     assert finance_data.incomes_data[0]["Salary"] == 5000
 
-def test_csv_input(tracker):
+def test_manual_input_skips_invalid_lines(monkeypatch):
+    monkeypatch.setattr(sys, "stdin", StringIO("-5\nabc\n1000 200\n\n" + "1000\n200\n50\n5000\n100\n" * 12))
+    finance_data = MonthlyFinanceTracker()
+    finance_data.collect_monthly_data()
+
+    assert finance_data.budgets_data.tolist() == [1000] * 12
+    assert finance_data.expense_matrix[0].tolist() == [200, 50]
+    assert finance_data.income_matrix[-1].tolist() == [5000, 100]
+
+def test_csv_input(tmp_path):
     # Creating a dummy csv file for testing
-    with open("test_data.csv", "w") as f:
-        f.write("Month,Budget,Extras,Utilities,Salary,Investments\n")
+    input_csv = tmp_path / "test_data.csv"
+    with open(input_csv, "w") as f:
+        f.write("Month,Budget,Extras,Utilities,Income_Salary,Income_Investments\n")
         f.write("1/2023,1000,200,50,5000,100\n")
 
-    tracker.collect_monthly_data("test_data.csv")
+    tracker = MonthlyFinanceTracker()
+    tracker.collect_monthly_data(str(input_csv))
     
+    assert tracker.months == ["1/2023"]
     assert tracker.budgets_data[0] == 1000
     assert tracker.expenses_data[0]["Extras"] == 200
     assert tracker.expenses_data[0]["Utilities"] == 50
-    assert tracker.incomes_data[0]["Salary"] == 5000
+    assert "Income_Salary" not in tracker.expenses_data[0]
+    assert tracker.incomes_data[0]["Income_Salary"] == 5000
+
+def test_csv_round_trip_keeps_cents(tmp_path):
+    input_csv = tmp_path / "large.csv"
+    input_csv.write_text("Month,Budget,Extras,Income_Salary\n1/2023,1234567.89,300000.07,19.99\n")
+
+    tracker = MonthlyFinanceTracker()
+    tracker.collect_monthly_data(str(input_csv))
+    tracker.save_data(str(tmp_path / "saved.csv"))
+
+    assert (tmp_path / "saved.csv").read_text().splitlines()[1] == "1/2023,1234567.89,300000.07,19.99"
+
+def test_csv_missing_column_leaves_data_unchanged(tmp_path, capsys):
+    input_csv = tmp_path / "no_budget.csv"
+    input_csv.write_text("Month,Extras,Income_Salary\n1/2023,5,6\n")
+
+    tracker = MonthlyFinanceTracker()
+    tracker.collect_monthly_data(str(input_csv))
+
+    assert "Error reading CSV" in capsys.readouterr().out
+    assert tracker.months == []
+    assert len(tracker.budgets_data) == 0
+    tracker.display_monthly_summaries()
+
+def test_to_dataframe_reflects_current_data():
+    tracker = MonthlyFinanceTracker()
+    tracker.collect_monthly_data("sample_data.csv")
+    df = tracker.to_dataframe()
+    df.loc[0, "Budget"] = 0
+    assert tracker.to_dataframe().loc[0, "Budget"] == 100
+
+    tracker.budgets_data[0] = 5
+    assert tracker.to_dataframe().loc[0, "Budget"] == 5
+
+def test_display_monthly_summaries(tracker, capsys):
+    tracker.display_monthly_summaries()
+    output = capsys.readouterr().out
+
+    assert output.startswith(
+        "Month: 1/2023\n"
+        "Expenses:\n"
+        "Extras: $200.00\n"
+        "Utilities: $50.00\n"
+        "Total Expenses: $250.00\n"
+        "Budget: $1000.00\n"
+        "Budget Remaining: $750.00\n"
+        "\n"
+        "Month: 2/2023\n"
+    )
+    assert output.endswith("Budget Remaining: $750.00\n\n")
+    assert output.count("Month: ") == 12
+
+def test_visualize_finances(tracker, monkeypatch):
+    monkeypatch.setattr(plt, "show", lambda: None)
+    tracker.visualize_finances()
+    ax = plt.gca()
+
+    # One line collection and one marker collection per series, whatever the number of months
+    assert len(ax.collections) == 6
+    assert [text.get_text() for text in ax.get_legend().get_texts()] == ["Budgets", "Expenses", "Incomes"]
+    plt.close("all")
+
+def test_totals_follow_reassigned_matrices(capsys):
+    tracker = MonthlyFinanceTracker.from_dataframe(pd.DataFrame({"Month": ["1/2023"], "Budget": [10], "Extras": [2]}))
+    tracker.display_monthly_summaries()
+    assert "Total Expenses: $2.00" in capsys.readouterr().out
+
+    tracker.expense_matrix = np.array([[7.0]])
+    tracker.display_monthly_summaries()
+    output = capsys.readouterr().out
+    assert "Extras: $7.00\nTotal Expenses: $7.00\n" in output
+    assert tracker.to_dataframe().loc[0, "Extras"] == 7
+
+def test_analysis(tracker, capsys):
+    tracker.analysis()
+    output = capsys.readouterr().out
+
+    assert "Analysis for Budget:\n\nMean: 1000.0\nMedian: 1000.0\nMode: 1000.0\n" in output
+    assert "Analysis for Income_Investments:\n\nMean: 100.0\nMedian: 100.0\nMode: 100.0\n" in output
+
+def test_analysis_skips_missing_values(tmp_path, capsys):
+    input_csv = tmp_path / "missing.csv"
+    input_csv.write_text(
+        "Month,Budget,Extras,Income_Salary\n"
+        "1/2023,19.99,10.5,\n"
+        "2/2023,19.99,,\n"
+        "3/2023,29.99,20.25,\n"
+    )
+    tracker = MonthlyFinanceTracker()
+    tracker.collect_monthly_data(str(input_csv))
+    tracker.analysis()
+    output = capsys.readouterr().out
+
+    assert "Analysis for Budget:\n\nMean: 23.323333333333334\nMedian: 19.99\nMode: 19.99\n" in output
+    assert "Analysis for Extras:\n\nMean: 15.375\nMedian: 15.375\nMode: 10.5\n" in output
+    assert "Analysis for Income_Salary:\n\nMean: nan\nMedian: nan\nMode: No mode\n" in output
+
+def test_summary_skips_missing_values(tmp_path, capsys):
+    input_csv = tmp_path / "missing.csv"
+    input_csv.write_text("Month,Budget,Extras,Utilities,Income_Salary\n1/2023,100,,20.5,\n")
+    tracker = MonthlyFinanceTracker()
+    tracker.collect_monthly_data(str(input_csv))
+    tracker.display_monthly_summaries()
+    output = capsys.readouterr().out
+
+    assert "Total Expenses: $20.50\n" in output
+    assert "Budget Remaining: $79.50\n" in output
+    assert tracker._monthly_totals()[1].tolist() == [0]
 
 # Add more test functions as required